@@ -0,0 +1,32 @@
+# Builds a julia system image (sysimage) with Korg, and compiled code for the functions
+# that korg.py calls, baked in. Loading korg.py with this sysimage avoids most of the
+# compilation latency of the first call to each wrapped function.
+#
+# This must be run with the julia executable and project that juliacall manages for
+# korg.py (see docs/startup_latency.rst for details):
+#
+#     julia --project=<juliapkg project> scripts/build_sysimage.jl [sysimage path]
+#
+# The sysimage path defaults to korg_sysimage.so in the current directory.
+
+import Pkg
+
+sysimage_path = abspath(get(ARGS, 1, "korg_sysimage.so"))
+
+# install PackageCompiler into a temporary environment that is stacked on top of the
+# active project (so that we don't modify the project managed by juliacall)
+korg_project = Base.active_project()
+Pkg.activate(; temp=true)
+Pkg.add("PackageCompiler")
+push!(LOAD_PATH, dirname(Base.active_project()))
+Pkg.activate(korg_project)
+
+using PackageCompiler
+
+create_sysimage(
+    [:Korg];
+    sysimage_path=sysimage_path,
+    precompile_execution_file=joinpath(@__DIR__, "precompile_korg.jl"),
+)
+
+println("Built $sysimage_path. Set PYTHON_JULIACALL_SYSIMAGE=$sysimage_path to use it.")
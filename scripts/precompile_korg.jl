@@ -0,0 +1,27 @@
+# The workload that build_sysimage.jl executes while building the sysimage. Everything
+# that gets compiled while running this file ends up in the sysimage.
+#
+# We try to call Korg with the same argument types that korg.py uses (e.g. the synth
+# wrapper in src/korg/_python_interface.py converts numeric parameters to Float64 and
+# (start, stop) wavelength ranges to a Vector{NTuple{2, Float64}})
+
+using Korg
+
+for linelist in (
+    Korg.get_APOGEE_DR17_linelist(; include_water=true),
+    Korg.get_GALAH_DR3_linelist(),
+    Korg.get_GES_linelist(; include_molecules=true),
+    Korg.get_VALD_solar_linelist(),
+)
+    Korg.synth(;
+        Teff=5777.0,
+        logg=4.44,
+        M_H=0.0,
+        linelist=linelist,
+        wavelengths=[(5000.0, 5001.0)],
+        rectify=true,
+        R=Inf,
+        vsini=0.0,
+        vmic=1.0,
+    )
+end
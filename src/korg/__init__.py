@@ -1,18 +1,26 @@
 import warnings
-from ._python_interface import (
-    Linelist as Linelist,
-    get_APOGEE_DR17_linelist,
-    get_GALAH_DR3_linelist,
-    get_GES_linelist,
-    get_VALD_solar_linelist,
-    read_linelist,
-    synth,
-)
+from typing import TYPE_CHECKING, Any
 
 # the _version file is generated as a part of the build process
 # we re-export to avoid ruff warnings
 from ._version import __version__ as __version__
 
+# configure the environment variables that juliacall reads when it starts julia
+# -> julia itself is only started once it's needed (see __getattr__). But, we need to
+#    do this right away in case something else imports juliacall first
+from . import _juliacall_env  # noqa: F401
+
+if TYPE_CHECKING:
+    from ._python_interface import (
+        Linelist as Linelist,
+        get_APOGEE_DR17_linelist,
+        get_GALAH_DR3_linelist,
+        get_GES_linelist,
+        get_VALD_solar_linelist,
+        read_linelist,
+        synth,
+    )
+
 __all__ = [
     "get_APOGEE_DR17_linelist",
     "get_GALAH_DR3_linelist",
@@ -22,4 +30,26 @@ __all__ = [
     "synth",
 ]
 
+# names that are lazily loaded from the _python_interface module
+# -> importing that module starts up julia and loads Korg (which can take a while).
+#    We defer doing that until one of these names is first accessed (see PEP 562), so
+#    that ``import korg`` is cheap
+_LAZY_PYTHON_INTERFACE_NAMES = frozenset(["Linelist", *__all__])
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_PYTHON_INTERFACE_NAMES:
+        from . import _python_interface
+
+        attr = getattr(_python_interface, name)
+        # cache the attribute so that __getattr__ isn't invoked for subsequent lookups
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_PYTHON_INTERFACE_NAMES)
+
+
 warnings.warn("korg.py is highly experimental. All functions/types can and will change")
@@ -0,0 +1,44 @@
+"""
+This module configures the environment variables that juliacall reads when it starts
+julia (if juliacall hasn't already been imported)
+
+This is separate from _julia_import because it doesn't start julia. We run it as soon as
+korg is imported (even though julia is only started once it is needed) so that julia is
+configured properly even if something else imports juliacall first.
+"""
+
+import os
+import sys
+import warnings
+
+# Check if JuliaCall is already loaded, and if so, warn the user
+# about the relevant environment variables. If not loaded,
+# set up sensible defaults.
+if "juliacall" in sys.modules:
+    warnings.warn(
+        "juliacall module already imported. "
+        "Make sure that you have set the environment variable `PYTHON_JULIACALL_HANDLE_SIGNALS=yes` to avoid segfaults. "
+        "Also note that korg.py will not be able to configure `PYTHON_JULIACALL_THREADS` or `PYTHON_JULIACALL_OPTLEVEL` for you."
+    )
+else:
+    # Required to avoid segfaults (https://juliapy.github.io/PythonCall.jl/dev/faq/)
+    if os.environ.get("PYTHON_JULIACALL_HANDLE_SIGNALS", "yes") != "yes":
+        warnings.warn(
+            "PYTHON_JULIACALL_HANDLE_SIGNALS environment variable is set to something other than 'yes' or ''. "
+            "You will experience segfaults if running with multithreading."
+        )
+
+    if os.environ.get("PYTHON_JULIACALL_THREADS", "auto") != "auto":
+        warnings.warn(
+            "PYTHON_JULIACALL_THREADS environment variable is set to something other than 'auto', "
+            "so korg.py was not able to set it. You may wish to set it to `'auto'` for full use "
+            "of your CPU."
+        )
+
+    # TODO: Remove these when juliapkg lets you specify this
+    for k, default in (
+        ("PYTHON_JULIACALL_HANDLE_SIGNALS", "yes"),
+        ("PYTHON_JULIACALL_THREADS", "auto"),
+        ("PYTHON_JULIACALL_OPTLEVEL", "3"),
+    ):
+        os.environ[k] = os.environ.get(k, default)
@@ -2,14 +2,16 @@
 This module defines the python interface to Korg
 """
 
+import functools
 import os
-from collections import ChainMap
-from collections.abc import Callable, Mapping
+import sys
+from collections.abc import Callable, Mapping, Sequence
 from typing import Any, Never, cast
 from ._julia_import import jl, Korg
 
 import numpy as np
 from juliacall import VectorValue as jlVectorValue
+from juliacall import convert as jlconvert
 
 # define some type aliases
 
@@ -38,6 +40,24 @@ type WavelengthsType = Any
 
 type Array1dF64 = np.ndarray[tuple[int], np.dtype[np.float64]]
 
+# bind the Korg functions that we wrap to module-level names
+# -> every attribute access on a julia module (e.g. ``Korg.synth``) performs a
+#    julia-side lookup, so we do it once rather than on every call
+_jl_get_APOGEE_DR17_linelist = Korg.get_APOGEE_DR17_linelist
+_jl_get_GALAH_DR3_linelist = Korg.get_GALAH_DR3_linelist
+_jl_get_GES_linelist = Korg.get_GES_linelist
+_jl_get_VALD_solar_linelist = Korg.get_VALD_solar_linelist
+_jl_read_linelist = Korg.read_linelist
+_jl_synth = Korg.synth
+
+
+# functions decorated by _perfect_jl_shadowing that are still waiting on their
+# docstrings (these are all retrieved at once, at the end of this module)
+_pending_jl_docstrings: list[Callable] = []
+# indicates whether the pending docstrings have been retrieved. Afterwards, the
+# docstring of each newly decorated function is retrieved immediately
+_jl_docstrings_flushed = False
+
 
 def _perfect_jl_shadowing[**P, T](fn: Callable[P, T]) -> Callable[P, T]:
     """A decorator for functions that perfectly shadows a Korg
@@ -45,12 +65,42 @@ def _perfect_jl_shadowing[**P, T](fn: Callable[P, T]) -> Callable[P, T]:
     The main purpose of this function is to add the Korg docstring. This should
     be used somewhat sparingly (i.e. in cases when we are confident that the
     docstring will never mention Julia-specific types)
+
+    To avoid a julia call per decorated function, the docstrings of all functions
+    decorated while this module is being imported are filled in together by
+    ``_flush_pending_jl_docstrings``
     """
-    _recycle_jl_docstring(fn)
+    _pending_jl_docstrings.append(fn)
+    if _jl_docstrings_flushed:
+        _flush_pending_jl_docstrings()
     return fn
 
 
-def _recycle_jl_docstring(fn: Callable):
+def _flush_pending_jl_docstrings():
+    global _jl_docstrings_flushed
+    # docstrings are stripped when python runs with ``-OO``, in which case there is
+    # no point in asking julia for them
+    if sys.flags.optimize < 2:
+        _recycle_jl_docstrings(_pending_jl_docstrings)
+    _pending_jl_docstrings.clear()
+    _jl_docstrings_flushed = True
+
+
+# a Julia function that retrieves the docstrings of the Korg symbols with the given
+# names (`@doc Korg.<name>` is just sugar for the expression used for each name)
+_get_jl_docstrings = jl.seval(
+    "names -> Tuple(Base.Docs.doc(Base.Docs.Binding(Korg, Symbol(n))).text[1] "
+    "for n in names)"
+)
+
+
+def _recycle_jl_docstrings(fns: Sequence[Callable]):
+    jl_docstrings = _get_jl_docstrings(tuple(fn.__name__ for fn in fns))
+    for fn, jl_docstring in zip(fns, jl_docstrings, strict=True):
+        _recycle_jl_docstring(fn, jl_docstring)
+
+
+def _recycle_jl_docstring(fn: Callable, jl_docstring: str):
     # this is experimental (to be used sparingly in cases when we are confident that
     # the docstrings won't mention Julia specific types)
     #
@@ -62,8 +112,6 @@ def _recycle_jl_docstring(fn: Callable):
     #       to restructured text. Since the docstrings of all public Korg functions
     #       largely share a common structure, it probably wouldn't be bad to do this
     #       with a few regex statements
-    jl_docstring = jl.seval(f"(@doc Korg.{fn.__name__}).text[1]")
-
     if jl_docstring.startswith(f"    {fn.__name__}("):
         first_newline = jl_docstring.index("\n")
         fn.__doc__ = jl_docstring[first_newline:].lstrip()
@@ -96,24 +144,49 @@ class Linelist:
         return f"{name}(<{length} lines>)"
 
 
+# the built-in linelists never change, so we memoize the private functions that load
+# them (rather than the public functions, so that the public signatures stay intact)
+# -> this avoids reading & parsing the linelist from disk on every call
+# -> it's fine to hand the same Linelist instance to multiple callers since the class
+#    doesn't provide a way to mutate the wrapped lines
+@functools.cache
+def _load_APOGEE_DR17_linelist(include_water: bool) -> Linelist:
+    return Linelist(_jl_get_APOGEE_DR17_linelist(include_water=include_water))
+
+
+@functools.cache
+def _load_GALAH_DR3_linelist() -> Linelist:
+    return Linelist(_jl_get_GALAH_DR3_linelist())
+
+
+@functools.cache
+def _load_GES_linelist(include_molecules: bool) -> Linelist:
+    return Linelist(_jl_get_GES_linelist(include_molecules=include_molecules))
+
+
+@functools.cache
+def _load_VALD_solar_linelist() -> Linelist:
+    return Linelist(_jl_get_VALD_solar_linelist())
+
+
 @_perfect_jl_shadowing
 def get_APOGEE_DR17_linelist(*, include_water: bool = True) -> Linelist:
-    return Linelist(Korg.get_APOGEE_DR17_linelist(include_water=include_water))
+    return _load_APOGEE_DR17_linelist(bool(include_water))
 
 
 @_perfect_jl_shadowing
 def get_GALAH_DR3_linelist() -> Linelist:
-    return Linelist(Korg.get_GALAH_DR3_linelist())
+    return _load_GALAH_DR3_linelist()
 
 
 @_perfect_jl_shadowing
 def get_GES_linelist(*, include_molecules: bool = True) -> Linelist:
-    return Linelist(Korg.get_GES_linelist(include_molecules=include_molecules))
+    return _load_GES_linelist(bool(include_molecules))
 
 
 @_perfect_jl_shadowing
 def get_VALD_solar_linelist() -> Linelist:
-    return Linelist(Korg.get_VALD_solar_linelist())
+    return _load_VALD_solar_linelist()
 
 
 # we can't currently reuse the exact Julia signature since the Julia signature
@@ -124,8 +197,12 @@ def read_linelist(
     format: str | None = None,
     isotopic_abundances: Mapping[int, Mapping[float, float]] | None = None,
 ) -> Linelist:
-    # coerce fname to a string
-    coerced_fname = os.fsdecode(fname)
+    # coerce fname to a string (skipping os.fsdecode's protocol checks in the common
+    # case where fname is already a str)
+    coerced_fname = fname if type(fname) is str else os.fsdecode(fname)
+    if not os.path.exists(coerced_fname):
+        # it's cheaper to check this before calling into julia
+        raise FileNotFoundError(f"no linelist file found at {coerced_fname!r}")
 
     # build up kwargs (we have to play some games here since we can't natively
     # represent the default values in python)
@@ -134,7 +211,49 @@ def read_linelist(
         kwargs["format"] = format
     if isotopic_abundances is not None:
         kwargs["isotopic_abundances"] = isotopic_abundances
-    return Linelist(Korg.read_linelist(coerced_fname, **kwargs))
+    return Linelist(_jl_read_linelist(coerced_fname, **kwargs))
+
+
+@functools.lru_cache(maxsize=128)
+def _jl_wavelength_ranges(ranges: tuple[tuple[KFloat, ...], ...]) -> jlVectorValue:
+    normalized = [tuple(float(v) for v in r) for r in ranges]
+    # when all ranges have the same length, we build a ``Vector{NTuple{N, Float64}}``.
+    # Otherwise, juliacall would pick the element type based on the inputs (e.g. a
+    # mix of python ints and floats produces a vector with an abstract element type,
+    # which forces dynamic dispatch within Korg.jl)
+    # -> we leave it to Korg.jl to fill in its default step for ``(start, stop)``
+    #    ranges (so that we never disagree with it). Consequently, a mix of 2-tuples
+    #    and 3-tuples can't be concretely typed
+    lengths = {len(r) for r in normalized}
+    if len(lengths) == 1:
+        (length,) = lengths
+        return jlconvert(jl.Vector[jl.Tuple[(jl.Float64,) * length]], normalized)
+    return jlconvert(jl.Vector, normalized)
+
+
+def _convert_wavelengths_param(wavelengths: WavelengthsType) -> Any:
+    """Coerce the ``wavelengths`` argument of :py:func:`synth` for Korg.jl
+
+    When ``wavelengths`` is a single range (a tuple) or a list of ranges, we reuse a
+    cached julia vector of ranges (so that repeated calls don't need to convert the
+    same ranges every time). Everything else is forwarded unchanged.
+    """
+    if isinstance(wavelengths, tuple):
+        # Korg.jl treats a single range identically to a vector holding just that range
+        ranges = (wavelengths,)
+    elif isinstance(wavelengths, list):
+        ranges = wavelengths
+    else:
+        return wavelengths
+    try:
+        key = tuple(tuple(r) for r in ranges)
+        if all(len(r) in (2, 3) for r in key):
+            return _jl_wavelength_ranges(key)
+    except (TypeError, ValueError):
+        # an entry either isn't a sequence or holds unhashable/non-numeric values
+        pass
+    # let juliacall and Korg.jl deal with anything unexpected
+    return wavelengths
 
 
 # we can't currently reuse the exact Julia signature since the Julia signature
@@ -241,12 +360,18 @@ def synth(
               types, at any time (e.g. between patch versions).
     """
 
+    # reject obviously invalid inputs before calling into julia (Korg.jl would
+    # reject them too, but only after compiling & running a lot of code)
+    # -> the comparison is written so that it also rejects NaN
+    if not Teff > 0:
+        raise ValueError(f"Teff must be positive, not {Teff}")
+
     # here, we deal with building up a subset of the keyword arguments where we use
     # None to indicate that we can't represent the default value in python
 
     partial_kwargs: dict[str, Any] = {}
     if alpha_H is not None:
-        partial_kwargs["alpha_H"] = alpha_H
+        partial_kwargs["alpha_H"] = float(alpha_H)
     if linelist is not None:
         partial_kwargs["linelist"] = linelist._lines
     if synthesize_kwargs is not None:
@@ -254,22 +379,29 @@ def synth(
     if format_A_X_kwargs is not None:
         partial_kwargs["format_A_X_kwargs"] = format_A_X_kwargs
 
-    tmp_wls, tmp_flux, tmp_continuum = Korg.synth(
-        Teff=Teff,
-        logg=logg,
-        M_H=M_H,
-        wavelengths=wavelengths,
-        rectify=rectify,
-        R=R,
-        vsini=vsini,
-        vmic=vmic,
-        **ChainMap(partial_kwargs, abundances),
+    # we convert all numeric arguments to python floats (and rectify to a bool) before
+    # calling into julia (alpha_H is converted when we build partial_kwargs)
+    # -> julia compiles a separate specialization of Korg.synth for every distinct
+    #    combination of argument types. Without these conversions, calls like
+    #    ``synth(Teff=5777, logg=4.44)`` and ``synth(Teff=5777.0, logg=4.44)`` (or
+    #    ``Fe=0`` and ``Fe=0.0``) would each pay for compilation
+    tmp_wls, tmp_flux, tmp_continuum = _jl_synth(
+        Teff=float(Teff),
+        logg=float(logg),
+        M_H=float(M_H),
+        wavelengths=_convert_wavelengths_param(wavelengths),
+        rectify=bool(rectify),
+        R=R if callable(R) else float(R),
+        vsini=float(vsini),
+        vmic=float(vmic),
+        **{element: float(A) for element, A in abundances.items()},
+        **partial_kwargs,
     )
 
     # we are returning numpy arrays that wrap each of the Julia vectors
     # -> because `juliacall.VectorValue` subclasses `juliacall.ArrayValue`, and
     #    `juliacall.ArrayValue` properly implements the `obj.__array_interface__`
-    #    python property, `arr = np.array(vec, copy=False)` makes `arr` reference
+    #    python property, `arr = vec.to_numpy(copy=False)` makes `arr` reference
     #    a ndarray instance that
     #    - reuses the memory of the underlying julia vector tracked within the python
     #      object that `vec` references
@@ -309,17 +441,26 @@ def synth(
     #         could be completed in a single step)
     #      2. we need julia to then deallocate its memory
     return (
-        np.array(tmp_wls, copy=False),
-        np.array(tmp_flux, copy=False),
-        np.array(tmp_continuum, copy=False),
+        tmp_wls.to_numpy(copy=False),
+        tmp_flux.to_numpy(copy=False),
+        tmp_continuum.to_numpy(copy=False),
     )
 
 
-# plug the default list of alpha elements directly into the docstring
-# -> note: we use ``cast`` purely to satisfy the type-checker; it has no effect at
-#    runtime (it simply returns the 2nd argument without any changes)
-synth.__doc__ = cast(str, synth.__doc__).format(
-    default_alpha_elements=", ".join(
-        Korg.atomic_symbols[i - 1] for i in Korg.default_alpha_elements
+# docstrings are stripped when python runs with ``-OO``, in which case there is no
+# point asking julia for any docstring content (and ``synth.__doc__`` is ``None``)
+if sys.flags.optimize < 2:
+    # plug the default list of alpha elements directly into the docstring
+    # -> we build the string in a single julia call (indexing into
+    #    Korg.atomic_symbols from python would require a separate round-trip for every
+    #    element)
+    # -> note: we use ``cast`` purely to satisfy the type-checker; it has no effect at
+    #    runtime (it simply returns the 2nd argument without any changes)
+    synth.__doc__ = cast(str, synth.__doc__).format(
+        default_alpha_elements=jl.seval(
+            'join((Korg.atomic_symbols[i] for i in Korg.default_alpha_elements), ", ")'
+        )
     )
-)
+
+# now that all of the shadowing functions are defined, fill in their docstrings
+_flush_pending_jl_docstrings()
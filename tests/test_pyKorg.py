@@ -5,3 +5,48 @@ def test_import():
     import korg
 
     korg.get_APOGEE_DR17_linelist()
+
+
+def test_builtin_linelists_are_memoized():
+    import korg
+
+    assert korg.get_APOGEE_DR17_linelist() is korg.get_APOGEE_DR17_linelist()
+    # passing the default value explicitly shouldn't load a second copy
+    assert korg.get_APOGEE_DR17_linelist() is korg.get_APOGEE_DR17_linelist(
+        include_water=True
+    )
+
+
+def test_synth_wavelength_formats():
+    import numpy as np
+
+    import korg
+    from korg.unstable import Korg, jl
+
+    # korg.py converts the wavelengths argument before passing it to Korg.jl. We check
+    # that this doesn't change the result by comparing against direct calls to Korg.jl
+    for py_wavelengths, jl_wavelengths in [
+        ((5000, 5005), (5000, 5005)),
+        ([(5000, 5005), (5200, 5205)], jl.seval("[(5000, 5005), (5200, 5205)]")),
+        ([(5000, 5005, 0.02)], jl.seval("[(5000, 5005, 0.02)]")),
+        (
+            [(5000, 5005), (5200, 5205, 0.03)],
+            jl.seval("[(5000, 5005), (5200, 5205, 0.03)]"),
+        ),
+    ]:
+        result = korg.synth(Teff=5777, logg=4.44, wavelengths=py_wavelengths)
+        ref = Korg.synth(Teff=5777, logg=4.44, wavelengths=jl_wavelengths)
+        for arr, ref_vec in zip(result, ref, strict=True):
+            np.testing.assert_allclose(arr, np.asarray(ref_vec), rtol=1e-12)
+
+
+def test_error_handling():
+    import pytest
+
+    import korg
+
+    with pytest.raises(ValueError):
+        korg.synth(Teff=-1000, logg=4.44)
+
+    with pytest.raises(FileNotFoundError):
+        korg.read_linelist("nonexistent_file.vald")